@@ -11,6 +11,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         'nltk',
+        'numpy',
     ],
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Module
+
+This module persists expensive precomputed data, such as the entropy solver's response table, in
+a cache directory so that later runs can load it instead of computing it again. Arrays are stored
+in NumPy's `.npy` format.
+
+The cache is best-effort: a missing or unreadable cache entry is treated as a miss, and a failure
+to write one is logged and otherwise ignored. Setting the `WORDLE_NO_CACHE` environment variable
+turns the cache off, so that nothing is read from or written to the cache directory.
+
+Copyright 2024 Arun K Viswanathan
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+"""
+import glob
+import hashlib
+import logging
+import os
+
+import numpy as np
+
+from constants import CACHE_DIR, CACHE_DISABLED
+
+
+def words_digest(words):
+    """
+    Computes a digest identifying a list of words, for use in cache file names.
+
+    Args:
+        words (list): The words to identify; their order is significant.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the words.
+    """
+    return hashlib.sha256('\n'.join(words).encode('utf-8')).hexdigest()
+
+
+def load_array(name):
+    """
+    Loads an array from the cache.
+
+    Args:
+        name (str): The file name of the array in the cache directory.
+
+    Returns:
+        numpy.ndarray: The array, or None if it is not in the cache.
+    """
+    if CACHE_DISABLED:
+        return None
+    try:
+        array = np.load(os.path.join(CACHE_DIR, name))
+    except (OSError, ValueError):
+        return None
+    logging.info("Loaded %s from the cache", name)
+    return array
+
+
+def save_array(name, array, stale_pattern=None):
+    """
+    Saves an array to the cache.
+
+    The array is written to a temporary file that is then renamed into place, so a concurrent
+    reader never sees a partially written file. Entries that the new one replaces, such as the
+    response table of a previous dictionary, can be removed by passing a pattern matching them.
+
+    Args:
+        name (str): The file name of the array in the cache directory.
+        array (numpy.ndarray): The array to save.
+        stale_pattern (str): A glob pattern of the file names in the cache directory to remove
+                             once the array is saved, other than `name` itself.
+
+    Returns:
+        None
+    """
+    if CACHE_DISABLED:
+        return
+    path = os.path.join(CACHE_DIR, name)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'wb') as cache_file:
+            np.save(cache_file, array)
+        os.replace(temp_path, path)
+    except OSError as error:
+        logging.warning("Could not save %s to the cache: %s", name, error)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+    if stale_pattern:
+        for stale_path in glob.glob(os.path.join(CACHE_DIR, stale_pattern)):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError as error:
+                    logging.warning("Could not remove %s from the cache: %s", stale_path, error)
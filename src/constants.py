@@ -7,6 +7,11 @@ This module defines several constants used throughout the Wordle solver applicat
 - `DEFAULT_TRIES`: The default maximum number of tries; 1 more than the default word length.
 - `LOG_FILE`: The name of the file where logs are written.
 - `WORDLE_STATS_FILE`: The name of the file where game statistics are stored.
+- `STATS_CHECKPOINT_INTERVAL`: The number of games between saves of the statistics in continuous
+  mode.
+- `CACHE_DIR`: The directory where precomputed data is cached between runs.
+- `CACHE_DISABLED`: Whether the cache is turned off, by setting the `WORDLE_NO_CACHE` environment
+  variable.
 
 These constants can be imported into other modules as needed.
 
@@ -23,16 +28,30 @@ Licensed under the Apache License, Version 2.0
 #
 #        http://www.apache.org/licenses/LICENSE-2.0
 
+import os
+
 DEFAULT_WORD_LENGTH = 5
 DEFAULT_TRIES = DEFAULT_WORD_LENGTH + 1
 LOG_FILE = 'wordle.log'
 WORDLE_STATS_FILE = 'wordle_stats.json'
+STATS_CHECKPOINT_INTERVAL = 100
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'wordle')
+CACHE_DISABLED = bool(os.environ.get('WORDLE_NO_CACHE'))
 FAILURE_PROMPT = "Please provide the correct word: "
 DEFAULT_NLTK_CORPUSES = ['brown']
 NLTK_CORPUSES = ['brown']
 # NLTK_CORPUSES = ['brown', 'reuters', 'webtext', 'inaugural', 'nps_chat', 'treebank', 'wordnet']
+ALPHABET_SIZE = 26
+ALL_LETTERS_MASK = (1 << ALPHABET_SIZE) - 1
+BEST_GUESSES_COUNT = 5
+RESPONSE_TABLE_BLOCK_SIZE = 1 << 20
+MAX_RESPONSE_CODE_LENGTH = 39  # The longest word length whose 3 ** L response codes fit in int64
 NO_MATCH = 'b'
 PARTIAL_MATCH = 'y'
 EXACT_MATCH = 'g'
+NO_MATCH_CODE = ord(NO_MATCH)
+PARTIAL_MATCH_CODE = ord(PARTIAL_MATCH)
+EXACT_MATCH_CODE = ord(EXACT_MATCH)
+RESPONSE_LETTERS = frozenset({NO_MATCH, PARTIAL_MATCH, EXACT_MATCH})
 RESPONSE_PROMPT = (f"Response (q quit, i invalid, {NO_MATCH} no match, {PARTIAL_MATCH} partial "
                    f"match, {EXACT_MATCH} exact match)? ")
@@ -10,13 +10,14 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 import math
-from collections import Counter
-from functools import reduce
-from math import log
-from multiprocessing import Manager, Process, cpu_count
 
-from responses import get_response_non_interactive
-from utils import chunk_list, print_best_guesses
+import numpy as np
+
+from cache import load_array, save_array, words_digest
+from constants import BEST_GUESSES_COUNT, RESPONSE_TABLE_BLOCK_SIZE
+from responses import compute_response_table
+from utils import print_best_guesses, top_indices
+from wordtable import encode_words
 
 
 class EntropySolver:
@@ -25,23 +26,31 @@ class EntropySolver:
 
     This class provides methods to compute entropy for a list of words and generate the best
     guess based on the computed entropy scores. The entropy is computed using the formula
-    -i * log(i) for each word in the list, where i is the frequency of the word.
+    -i * log(i) for each word in the list, where i is the frequency of the word. The responses
+    between every pair of words are computed once, up front, into a response table that all
+    entropy computations read from. The table is cached on disk for later runs.
 
     Attributes
     ----------
     quiet : bool
         A flag indicating whether to run the function quietly.
+    response_table : numpy.ndarray
+        The `(N, N)` response codes, where entry `[i, j]` is the response for guessing word `j`
+        when the answer is word `i`.
 
     Methods
     -------
-    guess(words: list) -> str:
-        Generate the best guess for a list of words based on their entropy scores.
+    load_response_table(words: list) -> numpy.ndarray:
+        Load the response table for a list of words, computing it if it is not cached.
+
+    guess(rows: numpy.ndarray) -> str:
+        Generate the best guess for the words at the given rows based on their entropy scores.
 
-    compute_entropy(words: list) -> list:
-        Compute entropy scores for each word in the given list of words.
+    compute_entropy(rows: numpy.ndarray) -> list:
+        Compute entropy scores for the words at the given rows and return the best few.
 
-    compute_entropy_for_word(word: str, words: list) -> tuple:
-        Compute entropy for a given word.
+    response_counts(codes: numpy.ndarray) -> tuple:
+        Count the responses in each row of a block of response codes.
     """
 
     def __init__(self, quiet, all_words):
@@ -57,84 +66,112 @@ class EntropySolver:
         """
         self.quiet = quiet
         self.all_words = all_words
-        self.all_word_entropy = EntropySolver.compute_entropy(all_words, True)
+        self.response_table = EntropySolver.load_response_table(all_words)
+        self.all_word_entropy = self.compute_entropy(np.arange(len(all_words)))
+
+    @staticmethod
+    def load_response_table(words):
+        """
+        Load the response table for a list of words, computing it if it is not cached.
+
+        Building the table is quadratic in the number of words, so it is saved to the cache
+        directory, keyed by the words, and loaded from there by later runs. A cached table that
+        does not have one row and one column per word is stale or corrupt, and is rebuilt. Only
+        the table of the latest dictionary is kept, since each one takes hundreds of megabytes.
+
+        Parameters:
+            words (list): The words to compute responses between.
 
-    def guess(self, words):
+        Returns:
+            numpy.ndarray: The `(N, N)` response table for the words.
+        """
+        cache_name = f"responses-{words_digest(words)}.npy"
+        response_table = load_array(cache_name)
+        if response_table is None or response_table.shape != (len(words), len(words)):
+            matrix = encode_words(words, len(words[0]))
+            response_table = compute_response_table(matrix, matrix)
+            save_array(cache_name, response_table, stale_pattern='responses-*.npy')
+        return response_table
+
+    def guess(self, rows):
         """
         Generate best guess for a list of words based on their entropy scores.
 
         Parameters:
-            words (list): A list of words to generate guesses for.
+            rows (numpy.ndarray): The indices in `all_words`, which are also the response table
+                                  rows, of the words to generate guesses for.
 
         Returns:
             str: The top guess word with the lowest entropy.
         """
 
-        if words == self.all_words:
+        # The candidates are always distinct rows, so as many rows as there are words are all of
+        # them and need no element-wise comparison
+        if len(rows) == len(self.all_words):
             word_scores = self.all_word_entropy
         else:
-            word_scores = self.compute_entropy(words, False)
+            word_scores = self.compute_entropy(rows)
         print_best_guesses(self.quiet, word_scores)
         return word_scores[0][0]
 
-    @staticmethod
-    def compute_entropy(words, parallel=False):
+    def compute_entropy(self, rows):
         """
         Compute the entropy of a list of words.
 
+        The responses of the words at `rows`, guessed against each word as the answer, are read
+        from the response table in blocks of answers and sorted within each answer, so that every
+        run of equal codes is one response and its length is the response's count. The memory
+        used therefore only depends on the number of words, not on the `3 ** L` possible
+        responses. With `n` words and response counts `c`, the entropy of a word is
+        `log(n) - sum(c * log(c)) / n`, where `c * log(c)` is read from a lookup table indexed
+        by the counts.
+
         Parameters:
-            words (list): A list of words for which to compute entropy.
-            parallel (bool): Flag indicating whether to compute entropy in parallel.
+            rows (numpy.ndarray): The response table rows of the words for which to compute
+                                  entropy.
 
         Returns:
-            list: A list of entropy values for each word in the input list.
+            list: The (word, entropy) tuples of the BEST_GUESSES_COUNT words with the highest
+                  entropy, sorted by descending entropy with ties in row order.
         """
-        if not parallel or len(words) < 800:
-            entropies = []
-            for word in words:
-                entropies.append(EntropySolver.compute_entropy_for_word(word, words))
-            entropies = sorted(entropies, key=lambda item: item[1], reverse=True)
-            return entropies
-        with Manager() as manager:
-            entropies = manager.list()
-            chunk_size = math.ceil(len(words) / cpu_count())
-            processes = []
-            for chunk in chunk_list(words, chunk_size):
-                process = Process(target=EntropySolver.compute_entropy_for_chunk,
-                                  args=(chunk, words, entropies))
-                process.start()
-                processes.append(process)
-            for process in processes:
-                process.join()
-            entropies = sorted(list(entropies), key=lambda item: item[1], reverse=True)
-            return entropies
+        word_count = len(rows)
+        counts_range = np.arange(word_count + 1)
+        count_log_counts = counts_range * np.log(np.maximum(counts_range, 1))
+        entropies = np.empty(word_count)
+        block_size = max(1, RESPONSE_TABLE_BLOCK_SIZE // max(1, word_count))
+        for first in range(0, word_count, block_size):
+            block_rows = rows[first:first + block_size]
+            run_rows, counts = self.response_counts(
+                self.response_table[block_rows[:, np.newaxis], rows])
+            # Adding up the counts of each word in ascending order makes words with the same
+            # distribution of responses get exactly the same entropy, so that ties are broken by
+            # row order
+            block_entropy = np.bincount(run_rows, weights=count_log_counts[counts],
+                                        minlength=len(block_rows))
+            entropies[first:first + block_size] = math.log(word_count) - block_entropy / word_count
+        best = top_indices(entropies, BEST_GUESSES_COUNT)
+        return [(self.all_words[rows[i]], float(entropies[i])) for i in best]
 
     @staticmethod
-    def compute_entropy_for_chunk(chunk, words, entropies):
+    def response_counts(codes):
         """
-        Compute entropy for a chunk of words and update the entropies list.
+        Count the responses in each row of a block of response codes.
 
-        :param chunk: List of words to compute entropy for
-        :param words: List of all words to use for entropy calculation
-        :param entropies: List to store the computed entropies
-        """
-        for word in chunk:
-            entropies.append(EntropySolver.compute_entropy_for_word(word, words))
-
-    @staticmethod
-    def compute_entropy_for_word(word, words):
-        """
-        Compute the entropy for a given word compared to other words in a list.
+        The codes of each row are sorted, so that every run of equal codes is one response and its
+        length is the response's count.
 
         Parameters:
-        word (str): The word for which entropy needs to be computed.
-        words (list): A list of words to compare against.
+            codes (numpy.ndarray): A `(B, n)` block of response codes.
 
         Returns:
-        tuple: A tuple containing the word and its computed entropy.
+            tuple: The row and the count of every response, as two arrays sorted by row and then
+                   by ascending count.
         """
-        responses = [get_response_non_interactive(word, other_word) for other_word in words]
-        response_freq_map = Counter(responses)
-        probabilities = [freq / len(words) for freq in response_freq_map.values()]
-        entropy = reduce(lambda x, y: x - y * log(y), probabilities, 0)
-        return word, entropy
+        # A stable sort is a radix sort for the small integer types the codes are stored in
+        codes = np.sort(codes, axis=1, kind='stable')
+        run_starts = np.ones(codes.shape, dtype=bool)
+        run_starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+        starts = np.flatnonzero(run_starts)
+        row_length = codes.shape[1]
+        keys = np.sort(starts // row_length * (row_length + 1) + np.diff(starts, append=codes.size))
+        return np.divmod(keys, row_length + 1)
@@ -18,9 +18,11 @@ Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
-from collections import Counter
+import numpy as np
 
-from utils import print_best_guesses
+from constants import ALPHABET_SIZE, BEST_GUESSES_COUNT
+from utils import print_best_guesses, top_indices
+from wordtable import encode_words
 
 
 class PositionProbabilitySolver:
@@ -28,97 +30,111 @@ class PositionProbabilitySolver:
     A class used to guess words based on the probabilities of each letter at each position in a
     given list of words.
 
-    ...
+    Scores are kept as integer letter counts rather than probabilities: every probability has the
+    same denominator, so ranking by counts picks the same words without any division. Counts are
+    only converted to probabilities for display.
+
+    The letter frequencies come from the whole dictionary and do not change between guesses, so
+    the score of every dictionary word is computed once, up front, and guesses only look up the
+    scores of the candidates by their index in the dictionary.
 
     Attributes
     ----------
-    letter_probabilities : list
-        A list of dictionaries, where each dictionary maps a letter to its probability at the
-        corresponding position in the words.
+    words : list
+        The dictionary words.
+    letter_frequencies : numpy.ndarray
+        A `(L, 26)` `int32` array giving the number of words with each letter at each position.
+    word_count : int
+        The number of words the letter frequencies were computed from.
+    word_scores : numpy.ndarray
+        The `int32` score of each dictionary word, aligned with `words`.
 
     Methods
     -------
-    guess(words):
-        Returns the word with the highest score from the given list of words.
-    compute_letter_probabilities(words):
-        Computes probability of each letter appearing at each position in the given list of words.
+    guess(rows):
+        Returns the word with the highest score from the words at the given indices.
+    compute_letter_frequencies(words):
+        Computes the number of words with each letter at each position in the given list of words.
     compute_word_scores(words):
-        Computes the score for each word in the given list of words based on the probabilities of
-        each letter at each position.
+        Computes the score for each word in the given list of words based on the frequencies of
+        each letter at each position, as an array aligned with the words.
     compute_word_score(word):
-        Computes score for a given word based on the probabilities of each letter at each position.
+        Computes score for a given word based on the frequencies of each letter at each position.
     """
 
     def __init__(self, quiet, words):
         self.quiet = quiet
-        self.letter_probabilities = PositionProbabilitySolver.compute_letter_probabilities(words)
+        self.words = words
+        self.letter_frequencies = PositionProbabilitySolver.compute_letter_frequencies(words)
+        self.word_count = len(words)
+        self.word_scores = self.compute_word_scores(words)
 
-    def guess(self, words):
+    def guess(self, rows):
         """
-        Returns the word with the highest score from the given list of words.
+        Returns the word with the highest score from the words at the given indices.
 
-        This function calculates the score of each word by calling the `compute_word_scores`
-        function for the list of words. It then returns the word with the highest score.
+        This function gathers the precomputed scores of the words and returns the word with the
+        highest score, picking only the top few scores for display instead of sorting all of them.
 
         Args:
-            words (list): The list of words to compute scores for and guess from.
+            rows (numpy.ndarray): The indices in `words` of the words to guess from.
 
         Returns:
             str: The word with the highest score.
         """
-        word_scores = self.compute_word_scores(words)
-        print_best_guesses(self.quiet, word_scores)
-        return word_scores[0][0]  # Pick the top probability word
+        scores = self.word_scores[rows]
+        best = top_indices(scores, BEST_GUESSES_COUNT)
+        print_best_guesses(self.quiet,
+                           [(self.words[rows[i]], scores[i] / self.word_count) for i in best])
+        return self.words[rows[best[0]]]  # Pick the top probability word
 
     @staticmethod
-    def compute_letter_probabilities(words):
+    def compute_letter_frequencies(words):
         """
-        Computes the probability of each letter appearing at each position in the given list of
-        words.
+        Computes the number of words with each letter at each position in the given list of words.
 
-        This function calculates the frequency of each letter at each position in the words, and
-        then divides each frequency by the total number of words to get the probability.
+        This function counts the letters at each position with a single `numpy.bincount` per
+        position over the encoded words.
 
         Args:
-            words (list): The list of words to compute letter probabilities for.
+            words (list): The list of words to compute letter frequencies for.
 
         Returns:
-            list: A list of dictionaries, where each dictionary maps a letter to its probability at
-             the corresponding position in the words.
+            numpy.ndarray: A `(L, 26)` `int32` array where entry `[i, c]` is the number of words
+             with letter `c` at position `i`.
         """
-        letter_frequencies = [Counter(word[i] for word in words)
-                              for i in range(len(words[0]))]
-        letter_probabilities = [{letter: freq / len(words) for letter, freq in frequencies.items()}
-                                for frequencies in letter_frequencies]
-        return letter_probabilities
+        matrix = encode_words(words, len(words[0]))
+        return np.stack([np.bincount(column, minlength=ALPHABET_SIZE)
+                         for column in matrix.T]).astype(np.int32)
 
     def compute_word_scores(self, words):
         """
-        Computes the score for each word in the given list of words based on the probabilities of
+        Computes the score for each word in the given list of words based on the frequencies of
         each letter at each position.
 
-        This function calculates the score of each word by calling the `compute_word_score` function
-        for each word in the list. The scores are then sorted in descending order.
+        This function encodes the words as a matrix of letter indices and gathers the frequency
+        of each letter at its position in a single NumPy indexing operation, summing across
+        positions to get the score of each word.
 
         Args:
             words (list): The list of words to compute scores for.
 
         Returns:
-            list: A list of tuples, where each tuple contains a word and its score, sorted in
-                  descending order of the scores.
+            numpy.ndarray: The `int32` score of each word, in the same order as `words`.
         """
-        word_scores = [(word, self.compute_word_score(word)) for word in words]
-        word_scores.sort(key=lambda x: x[1], reverse=True)
-        return word_scores
+        matrix = encode_words(words, len(words[0]))
+        return self.letter_frequencies[np.arange(matrix.shape[1]), matrix].sum(axis=1,
+                                                                                dtype=np.int32)
 
     def compute_word_score(self, word):
         """
-        Computes score for a given word based on the probabilities of each letter at each position.
+        Computes score for a given word based on the frequencies of each letter at each position.
 
         Args:
             word (str): The word to compute the score for.
 
         Returns:
-            float: The score of the word.
+            int: The score of the word.
         """
-        return sum(self.letter_probabilities[i].get(letter, 0.0) for i, letter in enumerate(word))
+        return int(sum(self.letter_frequencies[i, ord(letter) - ord('a')]
+                       for i, letter in enumerate(word)))
@@ -7,6 +7,10 @@ Functions:
     given word and guess.
     get_response_interactive(length): Prompts the user for a response and validates it.
     get_response_non_interactive(word, guess): Returns the response for a given word and guess.
+    compute_response_codes(guesses, answers): Computes the responses for many encoded guesses
+    and answers at once, as base-3 integer codes.
+    compute_response_table(answers, guesses): Computes the response codes for every pair of
+    encoded answer and guess.
     display_response(quiet, response): Displays the response to the user with colors.
     process_response(guess, response, search_space, known_letters, length): Processes the user's
     response to a guess.
@@ -17,9 +21,12 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 import logging
-from functools import lru_cache
 
-from constants import EXACT_MATCH, NO_MATCH, PARTIAL_MATCH, RESPONSE_PROMPT
+import numpy as np
+
+from constants import (ALL_LETTERS_MASK, EXACT_MATCH, EXACT_MATCH_CODE, MAX_RESPONSE_CODE_LENGTH,
+                       NO_MATCH, NO_MATCH_CODE, PARTIAL_MATCH, PARTIAL_MATCH_CODE,
+                       RESPONSE_LETTERS, RESPONSE_PROMPT, RESPONSE_TABLE_BLOCK_SIZE)
 
 
 def get_response(is_non_interactive, word, guess, length):
@@ -60,22 +67,23 @@ def get_response_interactive(length):
         response = input(RESPONSE_PROMPT)
         response = response.strip().lower()
         logging.info("Response: %s", response)
-        if (all(char in {EXACT_MATCH, PARTIAL_MATCH, NO_MATCH} for char in response)
-                and len(response) == length
-                or response == 'i' or response == 'q'):
+        if response in ('i', 'q') or (len(response) == length
+                                      and RESPONSE_LETTERS.issuperset(response)):
             break
         print("Invalid response. Please try again.")
     return response
 
 
-@lru_cache(maxsize=128)
 def get_response_non_interactive(word, guess):
     """
     Returns the response for a given word and guess.
 
     This function calculates the response for a given word and guess by comparing the letters at
     each position in the word and guess. It returns a string of EXACT_MATCH, PARTIAL_MATCH, and
-    NO_MATCH characters indicating the matches between the word and guess.
+    NO_MATCH characters indicating the matches between the word and guess. The first pass marks
+    exact matches and tallies the unmatched letters of the word; the second hands those letters
+    out as partial matches from left to right. The response is built in place in a fixed-size
+    `bytearray` and only decoded to a string at the end.
 
     Args:
         word (str): The word to compare against.
@@ -84,25 +92,90 @@ def get_response_non_interactive(word, guess):
     Returns:
         str: The response string.
     """
-    response = [NO_MATCH] * len(word)
-    counted_pos = set()
+    response = bytearray(NO_MATCH * len(word), 'ascii')
+    remaining = {}
 
-    # Process exact matches first
+    # Process exact matches first, tallying the letters of the word that are left unmatched
     for i, guess_letter in enumerate(guess):
         if word[i] == guess_letter:
-            response[i] = EXACT_MATCH
-            counted_pos.add(i)
+            response[i] = EXACT_MATCH_CODE
+        else:
+            remaining[word[i]] = remaining.get(word[i], 0) + 1
 
-    # Process partial matches
+    # Process partial matches from left to right, each one using up an unmatched letter
     for i, guess_letter in enumerate(guess):
-        if guess_letter in word and response[i] != EXACT_MATCH:
-            positions = [i for i, letter in enumerate(word) if letter == guess_letter]
-            for pos in positions:
-                if pos not in counted_pos:
-                    response[i] = PARTIAL_MATCH
-                    counted_pos.add(pos)
-                    break
-    return ''.join(response)
+        if response[i] != EXACT_MATCH_CODE and remaining.get(guess_letter, 0) > 0:
+            response[i] = PARTIAL_MATCH_CODE
+            remaining[guess_letter] -= 1
+    return response.decode('ascii')
+
+
+def compute_response_codes(guesses, answers):
+    """
+    Computes the responses for many guess and answer pairs at once.
+
+    This function applies the same rules as `get_response_non_interactive` with vectorized NumPy
+    operations, broadcasting `guesses` against `answers` so that either may be a single word. A
+    guess letter is an exact match if it equals the answer letter at the same position. Otherwise
+    it is a partial match if the answer has more unmatched occurrences of the letter than there
+    are unmatched occurrences of it earlier in the guess, which is the same as handing out the
+    unmatched occurrences from left to right. Each response is returned as an integer with one
+    base-3 digit per position (NO_MATCH=0, PARTIAL_MATCH=1, EXACT_MATCH=2), most significant
+    digit first.
+
+    Args:
+        guesses (numpy.ndarray): The `(..., L)` letter indices of the guesses.
+        answers (numpy.ndarray): The `(..., L)` letter indices of the words to compare against.
+
+    Returns:
+        numpy.ndarray: The response codes, with the broadcast shape of the inputs minus the last
+                       axis.
+
+    Raises:
+        ValueError: If the words are longer than MAX_RESPONSE_CODE_LENGTH, so that their response
+                    codes do not fit in 64-bit integers.
+    """
+    length = guesses.shape[-1]
+    if length > MAX_RESPONSE_CODE_LENGTH:
+        raise ValueError(f"Response codes of {length}-letter words do not fit in 64-bit integers")
+    shape = np.broadcast_shapes(guesses.shape, answers.shape)[:-1]
+    unmatched = [guesses[..., i] != answers[..., i] for i in range(length)]
+    codes = np.zeros(shape, dtype=np.int64)
+    for i in range(length):
+        letter = guesses[..., i]
+        remaining = np.zeros(shape, dtype=np.int8)
+        for k in range(length):
+            remaining += (answers[..., k] == letter) & unmatched[k]
+        for j in range(i):
+            remaining -= (guesses[..., j] == letter) & unmatched[j]
+        codes *= 3
+        codes += np.where(unmatched[i], remaining > 0, 2)
+    return codes
+
+
+def compute_response_table(answers, guesses):
+    """
+    Computes the responses for every pair of answer and guess.
+
+    The table is filled in blocks of answers so that the intermediate arrays used by
+    `compute_response_codes` stay small. Codes are stored in the smallest unsigned integer type
+    that holds every response of the word length, which is `uint8` for 5-letter words.
+
+    Args:
+        answers (numpy.ndarray): The `(N, L)` letter indices of the answers.
+        guesses (numpy.ndarray): The `(M, L)` letter indices of the guesses.
+
+    Returns:
+        numpy.ndarray: A `(N, M)` table where entry `[i, j]` is the response code for guessing
+                       `guesses[j]` when the answer is `answers[i]`.
+    """
+    table = np.empty((len(answers), len(guesses)),
+                     dtype=np.min_scalar_type(3 ** guesses.shape[1] - 1))
+    block_size = max(1, RESPONSE_TABLE_BLOCK_SIZE // max(1, len(guesses)))
+    for first in range(0, len(answers), block_size):
+        block = answers[first:first + block_size, np.newaxis, :]
+        table[first:first + block_size] = compute_response_codes(guesses[np.newaxis, :, :], block)
+    return table
 
 
 def display_response(quiet, response):
@@ -132,16 +205,20 @@ def process_response(guess, response, search_space, known_letters, length):
     """
     Processes the user's response to a guess.
 
-    This function updates the search space and known letters based on the user's response. It
-    processes EXACT_MATCH responses first, then PARTIAL_MATCH responses, and finally NO_MATCH
-    responses. For each type of response, it updates the known letters and the search space
-    accordingly.
+    This function updates the search space and known letters based on the user's response. A
+    single pass over the response sets the search space of EXACT_MATCH positions, removes the
+    letter from PARTIAL_MATCH positions, and records the positions of each response type and of
+    each guess letter as bitmasks, with bit `j` standing for position `j`. NO_MATCH responses are
+    then applied once per distinct letter with bitmask operations: a letter that is a partial
+    match elsewhere is only removed from its NO_MATCH positions, and any other letter is removed
+    from every position except where it is an exact match. Known letters list the exact matches
+    first, then the partial matches, in position order.
 
     Args:
         guess (str): The guess that was made.
         response (str): The user's response to the guess.
-        search_space (list): A list of sets, where each set contains the possible letters for the
-                             corresponding position in the word.
+        search_space (numpy.ndarray): A `uint32` array of 26-bit masks, where bit `c` of entry `i`
+                                      is set iff letter `c` is possible at position `i`.
         known_letters (list): A set of letters that are known to be in the word.
         length (int): The length of the word.
 
@@ -149,30 +226,30 @@ def process_response(guess, response, search_space, known_letters, length):
         None
     """
     known_letters.clear()
-    # Process EXACT_MATCH responses first
-    for i, response_letter in enumerate(response):
-        if response_letter == EXACT_MATCH:
+    letter_bits = [1 << (letter - ord('a')) for letter in guess.encode('ascii')]
+    exact_positions = 0
+    partial_positions = 0
+    no_match_positions = 0
+    letter_positions = {}
+    for i, response_code in enumerate(response.encode('ascii')):
+        letter_positions[letter_bits[i]] = letter_positions.get(letter_bits[i], 0) | 1 << i
+        if response_code == EXACT_MATCH_CODE:
             known_letters.append(guess[i])
-            search_space[i] = {guess[i]}
-
-    # Then process PARTIAL_MATCH responses
-    for i, response_letter in enumerate(response):
-        if response_letter == PARTIAL_MATCH:
-            known_letters.append(guess[i])
-            search_space[i].discard(guess[i])
-
-    # Finally, process NO_MATCH responses
-    for i, response_letter in enumerate(response):
-        if response_letter == NO_MATCH:
-            search_space[i].discard(guess[i])
-            other_exact_match_positions = set()
-            other_partial_match_positions = set()
-            for j, _ in enumerate(search_space):
-                if j != i and guess[j] == guess[i]:
-                    if response[j] == PARTIAL_MATCH:
-                        other_partial_match_positions.add(j)
-                    elif response[j] == EXACT_MATCH:
-                        other_exact_match_positions.add(j)
-            if not other_partial_match_positions:
-                for j in set(range(length)) - {i} - other_exact_match_positions:
-                    search_space[j].discard(guess[i])
+            search_space[i] = letter_bits[i]
+            exact_positions |= 1 << i
+        elif response_code == PARTIAL_MATCH_CODE:
+            search_space[i] &= ALL_LETTERS_MASK ^ letter_bits[i]
+            partial_positions |= 1 << i
+        elif response_code == NO_MATCH_CODE:
+            no_match_positions |= 1 << i
+    known_letters.extend(guess[i] for i in range(length) if partial_positions >> i & 1)
+
+    for letter_bit, positions in letter_positions.items():
+        if positions & no_match_positions:
+            if positions & partial_positions:
+                # The letter is elsewhere in the word, it just isn't at its NO_MATCH positions
+                targets = positions & no_match_positions
+            else:
+                # The letter is nowhere in the word except where it is an exact match
+                targets = ~(positions & exact_positions)
+            search_space[(targets >> np.arange(length)) & 1 != 0] &= ALL_LETTERS_MASK ^ letter_bit
@@ -22,55 +22,59 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 """
 
 import logging
-import string
+import math
+import multiprocessing
+import sys
 import time
 from collections import Counter
+from multiprocessing import cpu_count
 
-from constants import EXACT_MATCH, NLTK_CORPUSES
+import numpy as np
+
+from constants import ALL_LETTERS_MASK, EXACT_MATCH, MAX_RESPONSE_CODE_LENGTH, NLTK_CORPUSES
 from entropysolver import EntropySolver
 from positionprobabilitysolver import PositionProbabilitySolver
 from responses import display_response, get_response, process_response
-from stats import display_stats, finalize_stats, load_stats, save_stats
-from utils import quiet_print
-from wordlist import get_word_list
+from stats import (checkpoint_stats, display_stats, finalize_stats, load_stats, merge_stats,
+                   save_stats)
+from utils import chunk_list, quiet_print
+from wordlist import load_answers, load_words
 from wordprobabilitysolver import WordProbabilitySolver
+from wordtable import WordTable, letter_mask
 
 
-def trim_word_list_by_search_space(word_list, search_space, known_letters):
+def trim_word_list_by_search_space(word_table, candidates, search_space, known_letters):
     """
-    Trims the word list by the provided search space and known letters.
+    Trims the candidate words by the provided search space and known letters.
 
-    This function filters the word list by ensuring that each word only contains letters that are
-    in the corresponding position's search space and that all known letters are in the word.
+    This function filters the candidates by ensuring that each word only contains letters that
+    are in the corresponding position's search space and that all known letters are in the word.
+    The words that fit the search space and contain every known letter are found by intersecting
+    the bitsets of the inverted index in `word_table`, and only the candidates among them are
+    checked for known letters that occur more than once, against the precomputed letter counts of
+    each word in one vectorized comparison.
 
     Args:
-        word_list (list): The list of words to trim.
-        search_space (list): A list of sets, where each set contains the possible letters for the
-                             corresponding position in the word.
+        word_table (WordTable): The encoded dictionary of all words.
+        candidates (numpy.ndarray): The rows in `word_table` of the words to trim.
+        search_space (numpy.ndarray): A `uint32` array of 26-bit masks, where bit `c` of entry `i`
+                                      is set iff letter `c` is possible at position `i`.
         known_letters (list): A set of letters that are known to be in the word.
 
     Returns:
-        list: The trimmed word list.
+        numpy.ndarray: The rows of the candidates that were kept, in their original order.
     """
     known_letters_counter = Counter(known_letters)
+    matching = word_table.matching_rows(search_space, letter_mask(known_letters_counter))
+    candidates = candidates[matching[candidates]]
 
-    def are_known_letters_in_word_optimized(word):
-        """
-        Checks if all letters in `known_letters` list, including duplicates, are present in a word.
-
-        Args:
-            word (str): The word in which to check for the presence of the known letters.
-
-        Returns:
-            bool: True if all letters in `known_letters` (including duplicates) are present in word
-                  False otherwise.
-        """
-        word_counter = Counter(word)
-        return all(word_counter[letter] >= count for letter, count in known_letters_counter.items())
-
-    return [word for word in word_list
-            if all(word[i] in letters for i, letters in enumerate(search_space))
-            and are_known_letters_in_word_optimized(word)]
+    # Known letters must all be present, including duplicates
+    duplicates = {ord(letter) - ord('a'): count for letter, count in known_letters_counter.items()
+                  if count > 1}
+    if duplicates:
+        letter_counts = word_table.letter_counts[candidates[:, np.newaxis], list(duplicates)]
+        candidates = candidates[(letter_counts >= list(duplicates.values())).all(axis=1)]
+    return candidates
 
 
 def solve(args):
@@ -89,42 +93,160 @@ def solve(args):
         None
     """
     start_time = time.time()
-    all_words = sorted([word for word in get_word_list(args.dict) if
-                        len(word) == args.len and not word[0].isupper()])
+    all_words = load_words(tuple(args.dict), args.len)
     logging.info("Word list loaded with %s words", len(all_words))
+    word_table = WordTable(all_words, args.len)
+    # Bad answers are reported before the solver spends time building or loading its tables
+    answers = load_answer_words(word_table, args) if args.answers else all_words
     if args.solver == 'position':
         solver = PositionProbabilitySolver(args.quiet, all_words)
     elif args.solver == 'word':
         solver = WordProbabilitySolver(args.quiet, all_words, NLTK_CORPUSES)
     elif args.solver == 'entropy':
+        if args.len > MAX_RESPONSE_CODE_LENGTH:
+            sys.exit(f"The entropy solver supports words of up to {MAX_RESPONSE_CODE_LENGTH} "
+                     "letters")
         solver = EntropySolver(args.quiet, all_words)
     else:
         solver = PositionProbabilitySolver(args.quiet, all_words)
+    # Stats are kept in memory while playing, saved every few games in continuous mode, and
+    # written once more at the end, including when continuous interactive mode is interrupted
     stats = load_stats()
-    if args.continuous:
-        if args.non_interactive:
-            for word in all_words:
-                solver_worker(all_words, word, args, solver, stats)
-                quiet_print(args.quiet)
+    try:
+        if args.continuous:
+            if args.non_interactive:
+                solve_all_words(word_table, answers, args, solver, stats)
+            else:
+                while True:
+                    solver_worker(word_table, None, args, solver, stats)
+                    quiet_print(args.quiet)
+                    checkpoint_stats(stats)
         else:
-            while True:
-                solver_worker(all_words, None, args, solver, stats)
-                quiet_print(args.quiet)
-    else:
-        solver_worker(all_words, args.word, args, solver, stats)
-    save_stats(stats)
+            solver_worker(word_table, args.word, args, solver, stats)
+    finally:
+        save_stats(stats)
     end_time = time.time()
     if args.non_interactive:
         stats['solve_time'] = end_time - start_time
         display_stats(stats)
 
 
-def solver_worker(all_words, word, args, solver, stats):
+def load_answer_words(word_table, args):
+    """
+    Loads the answers to solve in continuous non-interactive mode and checks them.
+
+    An answer that is not in the dictionary can never be guessed, so benchmarking against it
+    would only count a failure that says nothing about the solver. The run is stopped with an
+    error instead when there are no answers or when some of them are not in the dictionary.
+
+    Args:
+        word_table (WordTable): The encoded dictionary of all words.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        list: The sorted answers, all of which are in the dictionary.
+    """
+    answers = load_answers(tuple(args.answers), args.len)
+    if not answers:
+        sys.exit(f"No {args.len}-letter answers were read from {', '.join(args.answers)}")
+    missing = [word for word in answers if word not in word_table.index]
+    if missing:
+        sys.exit(f"{len(missing)} of {len(answers)} answers are not in the dictionary and can "
+                 f"never be guessed, e.g. {', '.join(missing[:5])}")
+    logging.info("Answer list loaded with %s words", len(answers))
+    return answers
+
+
+def solve_all_words(word_table, words, args, solver, stats):
+    """
+    Plays a non-interactive game for every given word, such as every word in the dictionary.
+
+    The games are independent of each other, so in quiet mode they are split into one chunk of
+    words per CPU and each chunk is played in its own process. The processes are forked so that
+    they share the word table and the solver's tables, such as the entropy solver's response
+    table, instead of each receiving a pickled copy. The stats of the chunks are merged in order
+    once all of them have been played, and a chunk whose process failed is reported as an error
+    rather than leaving its games out of the stats. Otherwise, or where processes cannot be
+    forked, the games are played one after the other.
+
+    Args:
+        word_table (WordTable): The encoded dictionary of all words.
+        words (list): The distinct words to solve.
+        args (argparse.Namespace): The parsed command-line arguments.
+        solver: The solver object.
+        stats (dict): The statistics to update.
+
+    Returns:
+        None
+    """
+    if not args.quiet or cpu_count() == 1 or len(words) < cpu_count() or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        play_games(word_table, words, args, solver, stats)
+        return
+    context = multiprocessing.get_context('fork')
+    with context.Manager() as manager:
+        chunk_stats = manager.dict()
+        chunk_size = math.ceil(len(words) / cpu_count())
+        chunks = list(chunk_list(words, chunk_size))
+        processes = []
+        for chunk in chunks:
+            process = context.Process(target=play_games_for_chunk,
+                                      args=(word_table, chunk, args, solver, chunk_stats))
+            process.start()
+            processes.append(process)
+        for process in processes:
+            process.join()
+        for chunk, process in zip(chunks, processes):
+            if process.exitcode != 0:
+                raise RuntimeError(f"The games for the words {chunk[0]} to {chunk[-1]} failed "
+                                   f"with exit code {process.exitcode}")
+        for chunk in chunks:
+            merge_stats(stats, chunk_stats[chunk[0]])
+
+
+def play_games(word_table, words, args, solver, stats):
+    """
+    Plays a non-interactive game for each of the given words, saving the stats periodically.
+
+    Args:
+        word_table (WordTable): The encoded dictionary of all words.
+        words (list): The words to solve.
+        args (argparse.Namespace): The parsed command-line arguments.
+        solver: The solver object.
+        stats (dict): The statistics to update.
+
+    Returns:
+        None
+    """
+    for word in words:
+        solver_worker(word_table, word, args, solver, stats)
+        quiet_print(args.quiet)
+        checkpoint_stats(stats)
+
+
+def play_games_for_chunk(word_table, chunk, args, solver, chunk_stats):
+    """
+    Plays a non-interactive game for each word in a chunk and stores the stats of the chunk.
+
+    :param word_table: The encoded dictionary of all words
+    :param chunk: The words to solve
+    :param args: The parsed command-line arguments
+    :param solver: The solver object
+    :param chunk_stats: Shared dictionary to store the stats of each chunk in, keyed by the first
+                        word of the chunk
+    """
+    stats = {}
+    for word in chunk:
+        solver_worker(word_table, word, args, solver, stats)
+    chunk_stats[chunk[0]] = stats
+
+
+def solver_worker(word_table, word, args, solver, stats):
     """
     A function that serves as a solver worker, iterating through a list of words and processing
     responses until a solution is found or the maximum number of tries is reached.
     Parameters:
-    - all_words: a list of all words
+    - word_table: the encoded dictionary of all words
     - word: the word to solve in non-interactive mode
     - args: a dictionary of arguments
     - solver: the solver object
@@ -133,22 +255,26 @@ def solver_worker(all_words, word, args, solver, stats):
     - None
     """
     stats['played'] = stats.get('played', 0) + 1
-    search_space = [set(string.ascii_lowercase) for _ in range(args.len)]
+    search_space = np.full(args.len, ALL_LETTERS_MASK, dtype=np.uint32)
     known_letters = []
     solution = None
     tries = 0
-    words = all_words.copy()
+    solved_response = EXACT_MATCH * args.len
+    candidates = np.arange(len(word_table.words))
     while tries < args.tries:
-        if len(words) == 0:
+        if len(candidates) == 0:
             quiet_print(args.quiet, "No words left in the dictionary!")
             break
 
         quiet_print(args.quiet, f"Round: {(tries + 1)}")
-        quiet_print(args.quiet, f"Current possible answers: {len(words)}")
+        quiet_print(args.quiet, f"Current possible answers: {len(candidates)}")
 
-        # Generate a guess
-        guess = solver.guess(words)
-        words.remove(guess)
+        # Generate a guess; with a single candidate left there is nothing to score
+        if len(candidates) == 1:
+            guess = word_table.words[candidates[0]]
+        else:
+            guess = solver.guess(candidates)
+        candidates = candidates[candidates != word_table.index[guess]]
         quiet_print(args.quiet, f"Guess: {guess}")
         tries += 1
 
@@ -163,17 +289,21 @@ def solver_worker(all_words, word, args, solver, stats):
         if response == 'i':  # Try another word since Wordle didn't accept this word
             tries -= 1
             continue
-        if response == EXACT_MATCH * args.len:  # Wordle solved
+        if response == solved_response:  # Wordle solved
             quiet_print(args.quiet, f"Wordle solved in {tries} tries")
             solution = guess
             break
         process_response(guess, response, search_space, known_letters, args.len)
 
         # Trim the word list based on the search space and known letters
-        logging.debug("Known letters: %s", known_letters)
-        logging.debug("Search space: %s", search_space)
-        words = trim_word_list_by_search_space(words, search_space, known_letters)
-        logging.info("Words left: %s", len(words))
-        logging.debug("Words: %s", words)
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug:
+            logging.debug("Known letters: %s", known_letters)
+            logging.debug("Search space: %s", search_space)
+        candidates = trim_word_list_by_search_space(word_table, candidates, search_space,
+                                                    known_letters)
+        logging.info("Words left: %s", len(candidates))
+        if debug:  # Only look up the candidate words when they will be logged
+            logging.debug("Words: %s", word_table.words_at(candidates))
         quiet_print(args.quiet, "")  # New line for better readability
     finalize_stats(word, args, stats, solution, tries)
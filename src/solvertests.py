@@ -6,10 +6,24 @@ Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
+import math
+import os
+import tempfile
 import unittest
+from collections import Counter
+from unittest import mock
 
-from constants import EXACT_MATCH, NO_MATCH, PARTIAL_MATCH
-from responses import get_response_non_interactive
+import numpy as np
+
+from constants import ALL_LETTERS_MASK, BEST_GUESSES_COUNT, EXACT_MATCH, NO_MATCH, PARTIAL_MATCH
+from entropysolver import EntropySolver
+from responses import (compute_response_codes, compute_response_table,
+                       get_response_non_interactive, process_response)
+from solver import trim_word_list_by_search_space
+from stats import merge_stats
+from utils import top_indices
+from wordlist import load_answers
+from wordtable import WordTable, encode_words, letter_mask
 
 
 class SolverTestCase(unittest.TestCase):
@@ -23,6 +37,22 @@ class SolverTestCase(unittest.TestCase):
     Methods:
         test_guess_vs_word(self): A test function to compare the output of
         get_response_non_interactive with expected values.
+        test_trim_word_list_by_search_space(self): A test function to check the words kept by
+        trim_word_list_by_search_space.
+        test_response_codes(self): A test function to compare the output of
+        compute_response_codes and compute_response_table with get_response_non_interactive.
+        test_process_response(self): A test function to check the search space and known letters
+        left by process_response.
+        test_merge_stats(self): A test function to check the stats combined by merge_stats.
+        test_load_answers(self): A test function to check that answers are read without the NLTK
+        corpus fallback.
+        test_compute_entropy(self): A test function to compare the output of compute_entropy with
+        the entropy of the responses from get_response_non_interactive.
+        test_compute_entropy_long_words(self): A test function to check that compute_entropy
+        handles word lengths with far more possible responses than could be counted in a
+        histogram of every response.
+        test_top_indices(self): A test function to compare the output of top_indices with a stable
+        descending sort.
     """
 
     def test_guess_vs_word(self):
@@ -49,6 +79,162 @@ class SolverTestCase(unittest.TestCase):
         self.assertEqual(''.join([NO_MATCH, PARTIAL_MATCH, EXACT_MATCH, PARTIAL_MATCH, NO_MATCH]),
                          get_response_non_interactive('crepe', 'speed'))
 
+    def test_trim_word_list_by_search_space(self):
+        """
+        A test function to check the words kept by trim_word_list_by_search_space.
+        """
+        words = ['actor', 'arrow', 'erase', 'speed', 'steal']
+        word_table = WordTable(words, 5)
+        candidates = np.arange(len(words))
+        search_space = np.full(5, ALL_LETTERS_MASK, dtype=np.uint32)
+
+        def trim(known_letters):
+            return word_table.words_at(trim_word_list_by_search_space(word_table, candidates,
+                                                                      search_space, known_letters))
+
+        self.assertEqual(words, trim([]))
+        search_space[0] = letter_mask('s')
+        self.assertEqual(['speed', 'steal'], trim([]))
+        search_space[0] = ALL_LETTERS_MASK
+        search_space[1] = ALL_LETTERS_MASK ^ letter_mask('p')
+        self.assertEqual(['erase', 'steal'], trim(['e']))
+        self.assertEqual(['erase'], trim(['e', 'e']))
+
+    def test_response_codes(self):
+        """
+        A test function to compare the output of compute_response_codes and
+        compute_response_table with get_response_non_interactive.
+        """
+        words = ['actor', 'arrow', 'ardor', 'abide', 'crepe', 'dully', 'erase', 'quirk', 'slate',
+                 'speed', 'steal', 'taint']
+        digits = {NO_MATCH: 0, PARTIAL_MATCH: 1, EXACT_MATCH: 2}
+        matrix = encode_words(words, 5)
+        table = compute_response_table(matrix, matrix)
+        for i, guess in enumerate(words):
+            expected = [int(''.join(str(digits[char])
+                                    for char in get_response_non_interactive(word, guess)), 3)
+                        for word in words]
+            self.assertEqual(expected, compute_response_codes(matrix[i], matrix).tolist())
+            self.assertEqual(expected, compute_response_codes(matrix[i:i + 1], matrix).tolist())
+            self.assertEqual(expected, table[:, i].tolist())
+        long_matrix = encode_words(['a' * 40], 40)
+        with self.assertRaises(ValueError):
+            compute_response_table(long_matrix, long_matrix)
+
+    def test_process_response(self):
+        """
+        A test function to check the search space and known letters left by process_response.
+        """
+        def without(letters):
+            return ALL_LETTERS_MASK ^ letter_mask(letters)
+
+        cases = [
+            ('speed', 'erase', ['s', 'e', 'e'],
+             [without('spd'), without('pd'), without('epd'), without('epd'), without('pd')]),
+            ('ardor', 'arrow', ['a', 'r', 'o', 'r'],
+             [letter_mask('a'), letter_mask('r'), without('d'), letter_mask('o'), without('rd')]),
+            ('speed', 'steal', ['s', 'e'],
+             [letter_mask('s'), without('ped'), letter_mask('e'), without('ped'), without('ped')]),
+        ]
+        for guess, word, expected_known_letters, expected_search_space in cases:
+            search_space = np.full(len(guess), ALL_LETTERS_MASK, dtype=np.uint32)
+            known_letters = []
+            process_response(guess, get_response_non_interactive(word, guess), search_space,
+                             known_letters, len(guess))
+            self.assertEqual(expected_known_letters, known_letters)
+            self.assertEqual(expected_search_space, search_space.tolist())
+
+    def test_merge_stats(self):
+        """
+        A test function to check the stats combined by merge_stats.
+        """
+        stats = {'played': 3, 'solved': 2, 'average_tries': 3.0,
+                 'tries': {'actor': 2, 'arrow': 4}, 'failed': ['speed']}
+        merge_stats(stats, {'played': 2, 'solved': 1, 'average_tries': 6.0,
+                            'tries': {'erase': 6}, 'failed': ['abide']})
+        merge_stats(stats, {})
+        self.assertEqual({'played': 5, 'solved': 3, 'average_tries': 4.0,
+                          'tries': {'actor': 2, 'arrow': 4, 'erase': 6},
+                          'failed': ['abide', 'speed']}, stats)
+
+    def test_load_answers(self):
+        """
+        A test function to check that answers are read without the NLTK corpus fallback.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            answer_file = os.path.join(directory, 'answers.txt')
+            with open(answer_file, 'w', encoding='utf-8') as file:
+                file.write('speed\nabide\nToast\nerased\nabide\n')
+            missing_file = os.path.join(directory, 'missing.txt')
+            self.assertEqual(['abide', 'speed'], load_answers((answer_file, missing_file), 5))
+            self.assertEqual([], load_answers((missing_file,), 5))
+
+    def assert_entropy_matches_responses(self, words, rows_list):
+        """
+        Compares the output of compute_entropy for each list of rows with the entropy of the
+        responses from get_response_non_interactive.
+        """
+        with mock.patch('entropysolver.load_array', return_value=None), \
+                mock.patch('entropysolver.save_array'):
+            solver = EntropySolver(True, words)
+        for rows in rows_list:
+            candidates = [words[row] for row in rows]
+            expected = []
+            for word in candidates:
+                counts = Counter(get_response_non_interactive(word, other_word)
+                                 for other_word in candidates)
+                expected.append((word, -sum(count / len(candidates) *
+                                             math.log(count / len(candidates))
+                                             for count in counts.values())))
+            # Ties are in row order, and rounding keeps the naive sums of equal entropies equal
+            expected.sort(key=lambda word_entropy: -round(word_entropy[1], 9))
+            expected = expected[:BEST_GUESSES_COUNT]
+            # A block size smaller than the candidates histograms them in several blocks
+            for block_size in (1 << 20, 2 * len(rows)):
+                with mock.patch('entropysolver.RESPONSE_TABLE_BLOCK_SIZE', block_size):
+                    actual = solver.compute_entropy(np.array(rows))
+                self.assertEqual([word for word, _ in expected], [word for word, _ in actual])
+                for (_, expected_entropy), (_, entropy) in zip(expected, actual):
+                    self.assertAlmostEqual(expected_entropy, entropy)
+
+    def test_compute_entropy(self):
+        """
+        A test function to compare the output of compute_entropy with the entropy of the responses
+        from get_response_non_interactive.
+        """
+        words = ['abide', 'actor', 'ardor', 'arrow', 'crepe', 'dully', 'erase', 'quirk', 'slate',
+                 'speed', 'steal', 'taint']
+        self.assert_entropy_matches_responses(
+            words, [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11], [1, 3, 6, 9, 10], [2, 3], [7]])
+
+    def test_compute_entropy_long_words(self):
+        """
+        A test function to check that compute_entropy handles word lengths with far more possible
+        responses than could be counted in a histogram of every response.
+        """
+        rng = np.random.default_rng(0)
+        words = sorted({''.join(rng.choice(list('abc'), 30)) for _ in range(40)})
+        self.assert_entropy_matches_responses(words, [list(range(len(words))), [0, 5, 9, 20]])
+
+    def test_top_indices(self):
+        """
+        A test function to compare the output of top_indices with a stable descending sort.
+        """
+        cases = [
+            (np.array([0.5, 0.9, 0.7, 0.9, 0.7, 0.7, 0.1]), 3),  # Ties at the threshold
+            (np.array([0.5, 0.9, 0.7, 0.9, 0.7, 0.7, 0.1]), 4),
+            (np.array([0.2, 0.2, 0.2, 0.2]), 2),
+            (np.array([0.3, 0.8, 0.3]), 3),  # As many scores as indices
+            (np.array([0.3, 0.8, 0.3]), 5),  # Fewer scores than indices
+            (np.array([], dtype=np.float64), 5),
+            (np.array([3, 7, 1, 7, 3, 3, 0]), 3),  # Integer scores
+            (np.array([3, 7, 1, 7, 3, 3, 0], dtype=np.uint32), 4),
+            (np.array([0, 2, 0], dtype=np.uint32), 3),
+        ]
+        for scores, count in cases:
+            expected = np.argsort(-scores.astype(np.float64), kind='stable')[:count]
+            self.assertEqual(expected.tolist(), top_indices(scores, count).tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
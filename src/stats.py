@@ -11,6 +11,9 @@ the file does not exist or cannot be decoded, it returns an empty dictionary.
 The save_stats function attempts to open and write to a JSON file containing the game statistics.
 The statistics are provided as a dictionary and are written to the file in JSON format.
 
+Both functions use the `orjson` package for faster encoding and decoding when it is installed, and
+the standard `json` module otherwise.
+
 This module is part of a Wordle solver game and is used to keep track of game statistics such as
 the number of games played, the number of games solved, and the average number of tries to solve
 a game.
@@ -21,9 +24,16 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 
+import bisect
 import json
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
 
-from constants import FAILURE_PROMPT, WORDLE_STATS_FILE
+from constants import FAILURE_PROMPT, STATS_CHECKPOINT_INTERVAL, WORDLE_STATS_FILE
 from utils import quiet_print
 
 
@@ -39,6 +49,9 @@ def load_stats():
               not exist or cannot be decoded.
     """
     try:
+        if orjson:
+            with open(WORDLE_STATS_FILE, 'rb') as stats_file:
+                return orjson.loads(stats_file.read())  # pylint: disable=no-member
         with open(WORDLE_STATS_FILE, 'r', encoding='utf-8') as stats_file:
             return json.load(stats_file)
     except (FileNotFoundError, json.JSONDecodeError):
@@ -50,7 +63,12 @@ def save_stats(stats):
     Saves the Wordle game statistics to a file.
 
     This function attempts to open and write to a JSON file containing the game statistics.
-    The statistics are provided as a dictionary and are written to the file in JSON format.
+    The statistics are provided as a dictionary and are written to the file in JSON format. They
+    are written to a temporary file that is then renamed over the stats file, so that an
+    interrupted save never leaves a truncated stats file behind. The JSON is encoded in full and
+    written with a single call rather than chunk by chunk, and flushed to disk before the rename so
+    that a crash cannot leave an empty stats file in place of the old one either. A failed save
+    removes its temporary file.
 
     Args:
         stats (dict): A dictionary containing the game statistics.
@@ -58,8 +76,40 @@ def save_stats(stats):
     Returns:
         None
     """
-    with open(WORDLE_STATS_FILE, 'w', encoding='utf-8') as stats_file:
-        json.dump(stats, stats_file, indent=4)
+    temp_file = f"{WORDLE_STATS_FILE}.{os.getpid()}.tmp"
+    if orjson:  # orjson only supports indenting by two spaces
+        data = orjson.dumps(stats, option=orjson.OPT_INDENT_2)  # pylint: disable=no-member
+    else:
+        data = json.dumps(stats, indent=4).encode('utf-8')
+    try:
+        with open(temp_file, 'wb') as stats_file:
+            stats_file.write(data)
+            stats_file.flush()
+            os.fsync(stats_file.fileno())
+        os.replace(temp_file, WORDLE_STATS_FILE)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+
+
+def checkpoint_stats(stats):
+    """
+    Saves the Wordle game statistics every STATS_CHECKPOINT_INTERVAL games.
+
+    Long continuous runs keep their statistics in memory and save them at the end; checkpointing
+    bounds how many games are lost if the run is killed without a chance to save.
+
+    Args:
+        stats (dict): A dictionary containing the game statistics.
+
+    Returns:
+        None
+    """
+    if stats.get('played', 0) % STATS_CHECKPOINT_INTERVAL == 0:
+        save_stats(stats)
 
 
 def update_solved_stats(stats, solution, tries):
@@ -91,13 +141,14 @@ def update_failed_stats(word, args, stats):
     None
     """
     stats['failed'] = stats.get('failed', [])
-    if args.non_interactive:
-        stats['failed'].append(word)
-    else:
+    if not args.non_interactive:
         word = input(FAILURE_PROMPT)
-        if word:
-            stats['failed'].append(word)
-    stats['failed'] = sorted(list(set(stats['failed'])))  # Remove duplicates
+    # The list is kept sorted and free of duplicates, so a new word is found and inserted in place
+    if word:
+        failed = stats['failed']
+        position = bisect.bisect_left(failed, word)
+        if position == len(failed) or failed[position] != word:
+            failed.insert(position, word)
 
 
 def finalize_stats(word, args, stats, solution, tries):
@@ -121,6 +172,29 @@ def finalize_stats(word, args, stats, solution, tries):
         update_failed_stats(word, args, stats)
 
 
+def merge_stats(stats, other_stats):
+    """
+    Adds the statistics of games played separately, such as in another process, to stats.
+
+    Parameters:
+        stats (dict): The statistics dictionary to update.
+        other_stats (dict): The statistics of the other games.
+
+    Returns:
+        None
+    """
+    stats['played'] = stats.get('played', 0) + other_stats.get('played', 0)
+    if other_stats.get('solved', 0) > 0:
+        solved = stats.get('solved', 0) + other_stats['solved']
+        stats['average_tries'] = (stats.get('average_tries', 0) * stats.get('solved', 0) +
+                                  other_stats['average_tries'] * other_stats['solved']) / solved
+        stats['solved'] = solved
+        stats['tries'] = stats.get('tries', {})
+        stats['tries'].update(other_stats['tries'])
+    if 'failed' in other_stats:
+        stats['failed'] = sorted(set(stats.get('failed', [])) | set(other_stats['failed']))
+
+
 def display_stats(stats):
     """
     Display the game statistics to the user.
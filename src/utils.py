@@ -3,12 +3,18 @@ This module provides utility functions for the Wordle game statistics project.
 
 Functions:
     quiet_print(quiet, *args, **kwargs): Suppresses printing output when quiet mode is enabled.
+    print_best_guesses(quiet, word_scores): Displays the best guesses based on word scores.
+    top_indices(scores, count): Returns the indices of the highest scores without a full sort.
+    chunk_list(lst, chunk_size): Splits a list into chunks of a given size.
 
 Copyright 2024 Arun K Viswanathan
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
+import numpy as np
+
+from constants import BEST_GUESSES_COUNT
 
 
 def quiet_print(quiet, *args, **kwargs):
@@ -41,21 +47,49 @@ def print_best_guesses(quiet, word_scores):
     - None
     """
     if not quiet:
-        quiet_print(quiet, "Best guesses: ")
-        for _, (word, score) in enumerate(word_scores[:5]):
-            quiet_print(quiet, f"\t- {word}: ({score:.3f})")
+        # The header and the guesses are printed with a single write
+        lines = ["Best guesses: "]
+        lines.extend(f"\t- {word}: ({score:.3f})"
+                     for word, score in word_scores[:BEST_GUESSES_COUNT])
+        print('\n'.join(lines))
+
+
+def top_indices(scores, count):
+    """
+    A function to find the indices of the highest scores without sorting all of them.
+
+    The scores at or above the `count`-th highest score are selected with a linear-time
+    `numpy.partition`, and only those are sorted. Ties are broken by index, so the result matches
+    the first `count` entries of a stable descending sort.
+
+    Parameters:
+    - scores (numpy.ndarray): The scores to rank.
+    - count (int): The number of indices to return.
+
+    Returns:
+    - numpy.ndarray: The indices of the highest scores, best first.
+    """
+    if len(scores) > count:
+        threshold = np.partition(scores, len(scores) - count)[len(scores) - count]
+        indices = np.flatnonzero(scores >= threshold)
+    else:
+        indices = np.arange(len(scores))
+    # Reversing an ascending sort by score and then by descending index avoids negating the
+    # scores, which would wrap around for unsigned integers
+    order = np.lexsort((-indices, scores[indices]))[::-1]
+    return indices[order][:count]
 
 
-def chunk_list(lst, num_chunks):
+def chunk_list(lst, chunk_size):
     """
-    A function to split a list into chunks of size n.
+    A function to split a list into chunks of a given size.
 
     Parameters:
     - lst (list): The list to split into chunks.
-    - n (int): The size of each chunk.
+    - chunk_size (int): The size of each chunk; the last chunk may be smaller.
 
     Returns:
-    - list: A list of chunks.
+    - generator: The chunks, as slices of the list, in order.
     """
-    for i in range(0, len(lst), num_chunks):
-        yield lst[i:i + num_chunks]
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
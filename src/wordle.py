@@ -12,6 +12,8 @@ The command-line arguments are:
 `constants.DEFAULT_WORD_LENGTH`.
 - `-t` or `--tries`: The maximum number of tries. The default is the value of
 `constants.DEFAULT_TRIES`.
+- `-a` or `--answers`: Files of answers to solve in continuous non-interactive mode, instead of
+every word in the dictionary.
 
 This module is meant to be run as a script. It does not provide any functions or classes that can
 be imported into other modules.
@@ -43,6 +45,8 @@ def parse_arguments():
     `constants.DEFAULT_WORD_LENGTH`.
     - `-t` or `--tries`: The maximum number of tries. The default is the value of
     `constants.DEFAULT_TRIES`.
+    - `-a` or `--answers`: Files of answers to solve in continuous non-interactive mode, instead of
+    every word in the dictionary.
 
     Returns:
         argparse.Namespace: The parsed command-line arguments.
@@ -60,6 +64,9 @@ def parse_arguments():
                         help='The word to solve in non-interactive mode')
     parser.add_argument('-c', '--continuous', action='store_true', default=False,
                         help='Continuous mode; uses all words in the dictionary')
+    parser.add_argument('-a', '--answers', type=str, nargs='+',
+                        help='Answer files; continuous non-interactive mode uses these words '
+                             'instead of the dictionary')
     parser.add_argument('-s', '--solver', type=str, default='position',
                         choices=['position', 'word', 'entropy'],
                         help='Solver to use (default: position)')
@@ -73,6 +80,8 @@ def parse_arguments():
             parser.error("-w|--word and -c|--continuous arguments are mutually exclusive")
     elif args.word is not None:
         parser.error("-w|--word argument should not be used without -n|--non-interactive")
+    if args.answers and not (args.non_interactive and args.continuous):
+        parser.error("-a|--answers requires -n|--non-interactive and -c|--continuous")
     args.len = args.len or constants.DEFAULT_WORD_LENGTH
     args.tries = args.tries or constants.DEFAULT_TRIES
     return args
@@ -85,7 +94,7 @@ if __name__ == '__main__':
         if program_args.profile:
             PROFILER = cProfile.Profile()
             PROFILER.enable()
-        solve(parse_arguments())
+        solve(program_args)
         if program_args.profile:
             PROFILER.disable()
             PROFILER.print_stats(sort='cumtime')
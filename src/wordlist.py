@@ -11,6 +11,11 @@ it reads the file and returns a list of words. If the file does not exist, it at
 retrieve the word list from the NLTK corpus. If the NLTK corpus is not available, it downloads
 the corpus and then retrieves the word list.
 
+The `load_words` function applies the solver's filter to the word list: it keeps only the lowercase
+ASCII words of the requested length, sorted. The filtered words are cached in memory and, encoded
+as letter indices, on disk, keyed by the word files and their sizes and modification times, so
+later runs with the same dictionary skip reading and filtering it.
+
 This module is part of a Wordle solver game and is used to provide the list of words that the
 game can use.
 
@@ -21,29 +26,58 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 """
 
 import logging
+import os
+from functools import lru_cache
 
-import nltk
+from cache import load_array, save_array, words_digest
+from wordtable import decode_words, encode_words
 
 
-def get_word_list(word_lists: list) -> set:
+def read_word_files(word_lists: list) -> set:
     """
-    Generates a set of words from a list of word files.
+    Reads the set of words in a list of word files, reporting the files that cannot be found.
 
     Args:
         word_lists (list): A list of file paths to word files.
 
     Returns:
-        set: A set of words from the word files or the NLTK corpus words.
+        set: A set of words from the word files, which is empty if none of them could be read.
     """
     word_list = set()
     for word_file in word_lists:
         try:
             with open(word_file, 'r', encoding='utf-8') as file:
-                word_list = word_list.union([line.strip() for line in file])
+                word_list.update(map(str.strip, file.read().splitlines()))
         except FileNotFoundError:
             print(f"File {word_file} not found.")
+    return word_list
+
+
+def get_word_list(word_lists: list) -> set:
+    """
+    Generates a set of words from a list of word files.
+
+    Args:
+        word_lists (list): A list of file paths to word files.
+
+    Returns:
+        set: A set of words from the word files or the NLTK corpus words.
+    """
+    word_list = read_word_files(word_lists)
     if len(word_list) > 0:
         return word_list
+    return get_nltk_words()
+
+
+def get_nltk_words() -> list:
+    """
+    Returns the words of the NLTK words corpus, downloading the corpus if it is not installed.
+
+    Returns:
+        list: The NLTK corpus words.
+    """
+    # NLTK takes a noticeable time to import and is only needed when no word file can be read
+    import nltk  # pylint: disable=import-outside-toplevel
     try:
         nltk_words = nltk.corpus.words.words()
     except LookupError:
@@ -52,3 +86,87 @@ def get_word_list(word_lists: list) -> set:
         nltk_words = nltk.corpus.words.words()
         logging.info("NLTK corpus downloaded with %s words", len(nltk_words))
     return nltk_words
+
+
+def word_lists_key(word_lists, length):
+    """
+    Computes the cache key of the filtered words from a list of word files.
+
+    Args:
+        word_lists (tuple): The file paths of the word files.
+        length (int): The length of the words.
+
+    Returns:
+        str: A digest of the word length and of the path, size and modification time of each file,
+             or None if a file cannot be found.
+    """
+    key = [str(length)]
+    for word_file in word_lists:
+        try:
+            file_stat = os.stat(word_file)
+        except OSError:
+            return None
+        key.append(f"{os.path.abspath(word_file)}:{file_stat.st_size}:{file_stat.st_mtime_ns}")
+    return words_digest(key)
+
+
+@lru_cache(maxsize=8)
+def load_words(word_lists: tuple, length: int) -> list:
+    """
+    Returns the sorted lowercase ASCII words of the given length from a list of word files.
+
+    The words are only cached on disk when every word file exists and words were read from them,
+    so that a missing file is still reported and the NLTK corpus fallback is never cached.
+
+    Args:
+        word_lists (tuple): The file paths of the word files.
+        length (int): The length of the words to keep.
+
+    Returns:
+        list: The sorted words from the word files, or from the NLTK corpus if there are none.
+    """
+    key = word_lists_key(word_lists, length)
+    name = f"words-{key}.npy"
+    if key is not None:
+        matrix = load_array(name)
+        if matrix is not None and matrix.ndim == 2 and matrix.shape[1] == length:
+            return decode_words(matrix)
+    word_list = read_word_files(list(word_lists))
+    if not word_list:  # Every file is missing or empty
+        return filter_words(get_nltk_words(), length)
+    words = filter_words(word_list, length)
+    if key is not None:
+        save_array(name, encode_words(words, length))
+    return words
+
+
+def load_answers(answer_lists: tuple, length: int) -> list:
+    """
+    Returns the sorted lowercase ASCII words of the given length from a list of answer files.
+
+    Unlike `load_words`, there is no NLTK corpus fallback, so answer files that cannot be read
+    give no answers instead of the whole corpus.
+
+    Args:
+        answer_lists (tuple): The file paths of the answer files.
+        length (int): The length of the words to keep.
+
+    Returns:
+        list: The sorted words from the answer files, which is empty if none could be read.
+    """
+    return filter_words(read_word_files(list(answer_lists)), length)
+
+
+def filter_words(words, length):
+    """
+    Returns the sorted lowercase ASCII words of the given length.
+
+    Args:
+        words (iterable): The words to filter.
+        length (int): The length of the words to keep.
+
+    Returns:
+        list: The sorted words that were kept.
+    """
+    return sorted(word for word in words if
+                  len(word) == length and word.isascii() and word.isalpha() and word.islower())
@@ -4,6 +4,9 @@ Word Probability Solver Module
 
 Used to guess words based on the probabilities of each word in an NLTK corpus.
 
+Scanning the corpus for words of the right length dominates the solver's startup, so the corpus
+frequencies of the dictionary words are cached on disk, keyed by the corpuses and the dictionary.
+
 Copyright 2024 Arun K Viswanathan
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -11,10 +14,11 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 """
 from collections import Counter
 
-import nltk
+import numpy as np
 
-from constants import DEFAULT_NLTK_CORPUSES
-from utils import print_best_guesses
+from cache import load_array, save_array, words_digest
+from constants import BEST_GUESSES_COUNT, DEFAULT_NLTK_CORPUSES
+from utils import print_best_guesses, top_indices
 
 
 class WordProbabilitySolver:
@@ -26,11 +30,16 @@ class WordProbabilitySolver:
 
     Attributes:
         quiet (bool): A flag indicating whether to run in quiet mode.
-        br_word_freq (dict): A dictionary mapping words to their frequencies in the corpus.
+        words (list): The dictionary words.
+        word_scores (numpy.ndarray): The corpus frequency of each dictionary word, aligned with
+                                     `words`.
 
     Methods:
         __init__(self, quiet, words, corpuses): Initializes the WordProbabilitySolver.
-        guess(self, words): Returns the word with the highest frequency in the corpus.
+        guess(self, rows): Returns the word with the highest frequency in the corpus.
+        load_word_scores(words, corpuses): Loads the corpus frequency of each word, computing it
+        if it is not cached.
+        compute_word_scores(words, corpuses): Computes the corpus frequency of each word.
     """
 
     def __init__(self, quiet, words, corpuses):
@@ -46,11 +55,53 @@ class WordProbabilitySolver:
             None
         """
         self.quiet = quiet
-        word_len = len(words[0])
-        corpus_words = self.get_corpus_words(corpuses, word_len)
+        self.words = words
+        self.word_scores = WordProbabilitySolver.load_word_scores(words, corpuses)
+
+    @staticmethod
+    def load_word_scores(words, corpuses):
+        """
+        Load the corpus frequency of each word, computing it if it is not cached.
+
+        Parameters:
+            words (list): The dictionary words.
+            corpuses (list): A list of corpuses to search for words.
+
+        Returns:
+            numpy.ndarray: The `float64` corpus frequency of each word, in the same order as
+                           `words`.
+        """
+        corpuses = corpuses or DEFAULT_NLTK_CORPUSES
+        cache_name = f"word-scores-{words_digest(list(corpuses) + [''] + list(words))}.npy"
+        word_scores = load_array(cache_name)
+        if word_scores is None or word_scores.shape != (len(words),):
+            word_scores = WordProbabilitySolver.compute_word_scores(words, corpuses)
+            save_array(cache_name, word_scores)
+        return word_scores
+
+    @staticmethod
+    def compute_word_scores(words, corpuses):
+        """
+        Compute the corpus frequency of each word.
+
+        Only the counts of the dictionary words are looked up, and they are divided by the number
+        of corpus words in a single array operation. Every word scores 0 when the corpuses have no
+        words of the same length.
+
+        Parameters:
+            words (list): The dictionary words.
+            corpuses (list): A list of corpuses to search for words.
+
+        Returns:
+            numpy.ndarray: The `float64` corpus frequency of each word, in the same order as
+                           `words`.
+        """
+        corpus_words = WordProbabilitySolver.get_corpus_words(corpuses, len(words[0]))
+        if not corpus_words:  # No word of this length is in the corpuses, so none has a frequency
+            return np.zeros(len(words))
         br_word_counts = Counter(corpus_words)
-        self.br_word_freq = \
-            {word: br_word_counts[word] / len(corpus_words) for word in corpus_words}
+        counts = np.array([br_word_counts[word] for word in words], dtype=np.float64)
+        return counts / len(corpus_words)
 
     @staticmethod
     def get_corpus_words(corpuses, word_len):
@@ -61,29 +112,38 @@ class WordProbabilitySolver:
         :param word_len: An integer representing the desired length of the words to extract.
         :return: A list of words from the corpuses that have the specified length.
         """
+        # NLTK takes a noticeable time to import and is only needed to scan the corpuses
+        import nltk  # pylint: disable=import-outside-toplevel
         if not corpuses:
             corpuses = DEFAULT_NLTK_CORPUSES
         corpus_words = []
         for corpus in corpuses:
-            nltk.download(corpus)
             corpus_module = getattr(nltk.corpus, corpus)
             if corpus_module is None:
                 corpus_module = nltk.corpus.brown
-            corpus_words.extend([word.lower() for word in corpus_module.words()
-                                 if len(word) == word_len])
+            try:
+                tokens = corpus_module.words()
+            except LookupError:  # Only download a corpus that is not installed yet
+                nltk.download(corpus)
+                tokens = corpus_module.words()
+            corpus_words.extend([word.lower() for word in tokens if len(word) == word_len])
         return corpus_words
 
-    def guess(self, words):
+    def guess(self, rows):
         """
         Generate best guess for a list of words based on their scores and return the top guess.
 
+        The corpus frequency of every dictionary word is looked up once, up front, so this only
+        gathers the frequencies of the words and picks the few best for display with
+        `utils.top_indices`, which keeps ties in index order like a stable sort.
+
         Parameters:
-            words (list): A list of words to generate guesses for.
+            rows (numpy.ndarray): The indices in `words` of the words to generate guesses for.
 
         Returns:
             str: The top guess word with the highest score.
         """
-        word_scores = [(word, self.br_word_freq.get(word, 0)) for word in words]
-        word_scores = sorted(word_scores, key=lambda item: item[1], reverse=True)
-        print_best_guesses(self.quiet, word_scores)
-        return word_scores[0][0]
+        scores = self.word_scores[rows]
+        best = top_indices(scores, BEST_GUESSES_COUNT)
+        print_best_guesses(self.quiet, [(self.words[rows[i]], scores[i]) for i in best])
+        return self.words[rows[best[0]]]
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Word Table Module
+
+This module provides the `WordTable` class, which holds the dictionary words used by the Wordle
+solver together with a NumPy encoding of them. Each word is stored as a row of letter indices
+(a=0 .. z=25) in an `(N, L)` `uint8` matrix, along with the number of times each letter occurs in
+it. The encoded form lets the solver filter candidate words with vectorized NumPy operations
+instead of per-character Python loops.
+
+The table also keeps an inverted index of the words as bitsets, with bit `w` of a bitset standing
+for the word in row `w`: one bitset per letter and position for the words with that letter at
+that position, and one per letter for the words containing that letter. Filtering by a search
+space then only ORs and ANDs a few hundred 64-bit integers instead of scanning every word.
+
+Copyright 2024 Arun K Viswanathan
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+"""
+import numpy as np
+
+from constants import ALL_LETTERS_MASK, ALPHABET_SIZE
+
+
+def encode_words(words, length):
+    """
+    Encodes a list of lowercase words as a matrix of letter indices.
+
+    Args:
+        words (list): The words to encode; all must be `length` lowercase ASCII letters.
+        length (int): The length of each word.
+
+    Returns:
+        numpy.ndarray: A `(len(words), length)` `uint8` matrix where each entry is the index of
+                       the letter in the alphabet (a=0 .. z=25).
+    """
+    if not words:
+        return np.empty((0, length), dtype=np.uint8)
+    buffer = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return buffer.reshape(-1, length) - ord('a')
+
+
+def decode_words(matrix):
+    """
+    Decodes a matrix of letter indices back into words.
+
+    Args:
+        matrix (numpy.ndarray): A `(N, L)` matrix of letter indices, as built by `encode_words`.
+
+    Returns:
+        list: The `N` words, in the same order as the rows of `matrix`.
+    """
+    length = matrix.shape[1]
+    text = (matrix.astype(np.uint8) + ord('a')).tobytes().decode('ascii')
+    return [text[start:start + length] for start in range(0, len(text), length)]
+
+
+def letter_mask(letters):
+    """
+    Computes the 26-bit mask of a collection of letters.
+
+    Args:
+        letters (iterable): The lowercase letters to include in the mask.
+
+    Returns:
+        int: The mask with bit `c` set for each letter `c` in `letters`.
+    """
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (ord(letter) - ord('a'))
+    return mask
+
+
+def pack_bitsets(flags):
+    """
+    Packs boolean flags into bitsets of 64-bit integers.
+
+    Args:
+        flags (numpy.ndarray): A `(..., N)` boolean array.
+
+    Returns:
+        numpy.ndarray: A `(..., ceil(N / 64))` `uint64` array where bit `w % 64` of entry
+                       `w // 64` is set iff `flags[..., w]` is set.
+    """
+    packed = np.packbits(flags, axis=-1, bitorder='little')
+    padding = -packed.shape[-1] % 8
+    packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, padding)])
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def unpack_bitset(bitset, count):
+    """
+    Unpacks a bitset of 64-bit integers into boolean flags.
+
+    Args:
+        bitset (numpy.ndarray): A `(ceil(N / 64),)` `uint64` bitset, as built by `pack_bitsets`.
+        count (int): The number of flags `N` to unpack.
+
+    Returns:
+        numpy.ndarray: A `(N,)` boolean array where entry `w` is set iff bit `w` is set.
+    """
+    return np.unpackbits(bitset.view(np.uint8), count=count, bitorder='little').view(bool)
+
+
+class WordTable:
+    """
+    A class holding the dictionary words along with their NumPy encoding.
+
+    Attributes:
+        words (list): The dictionary words, in a fixed order.
+        length (int): The length of each word.
+        index (dict): Maps each word to its row in the encoded arrays.
+        matrix (numpy.ndarray): The `(N, L)` `uint8` matrix of letter indices.
+        letter_counts (numpy.ndarray): The `(N, 26)` `uint8` number of times each letter occurs
+                                       in each word.
+        position_bitsets (numpy.ndarray): A `(L, 26, ceil(N / 64))` `uint64` array holding the
+                                          bitset of the words with letter `c` at position `i` in
+                                          entry `[i, c]`.
+        letter_bitsets (numpy.ndarray): A `(26, ceil(N / 64))` `uint64` array holding the bitset
+                                        of the words containing letter `c` in entry `[c]`.
+
+    Methods:
+        words_at(rows): Returns the words at the given rows of the encoded arrays.
+        matching_rows(search_space, known_mask): Returns which words fit a search space and
+        contain a set of letters.
+    """
+
+    def __init__(self, words, length):
+        """
+        Initialize the table by encoding the given words.
+
+        Parameters:
+            words (list): The dictionary words; all must be `length` lowercase ASCII letters.
+            length (int): The length of each word.
+
+        Returns:
+            None
+        """
+        self.words = words
+        self.length = length
+        self.index = {word: i for i, word in enumerate(words)}
+        self.matrix = encode_words(words, length)
+        self.letter_counts = np.zeros((len(words), ALPHABET_SIZE), dtype=np.uint8)
+        for column in self.matrix.T:
+            self.letter_counts[np.arange(len(words)), column] += 1
+        alphabet = np.arange(ALPHABET_SIZE, dtype=np.uint8)
+        self.position_bitsets = pack_bitsets(self.matrix.T[:, np.newaxis, :]
+                                             == alphabet[np.newaxis, :, np.newaxis])
+        self.letter_bitsets = pack_bitsets(self.letter_counts.T > 0)
+
+    def words_at(self, rows):
+        """
+        Returns the words at the given rows of the encoded arrays.
+
+        Args:
+            rows (numpy.ndarray): Row indices into the table.
+
+        Returns:
+            list: The words at the rows, in the same order as `rows`.
+        """
+        return [self.words[row] for row in rows]
+
+    def matching_rows(self, search_space, known_mask):
+        """
+        Returns which words fit a search space and contain a set of letters.
+
+        For each position this ORs together the bitsets of the letters the search space allows
+        there, then ANDs the results across positions and with the bitsets of the known letters.
+        Positions that allow every letter are skipped, and positions fixed to a single letter use
+        that letter's bitset directly.
+
+        Args:
+            search_space (numpy.ndarray): A `uint32` array of 26-bit masks, where bit `c` of
+                                          entry `i` is set iff letter `c` is possible at
+                                          position `i`.
+            known_mask (int): The 26-bit mask of the letters every word must contain.
+
+        Returns:
+            numpy.ndarray: A `(N,)` boolean array where entry `w` is set iff the word in row `w`
+                           matches.
+        """
+        alphabet = np.arange(ALPHABET_SIZE, dtype=np.uint32)
+        known = (known_mask >> alphabet) & 1 != 0
+        matches = np.bitwise_and.reduce(self.letter_bitsets[known], axis=0,
+                                        initial=np.iinfo(np.uint64).max)
+        for i, allowed in enumerate(search_space.tolist()):
+            if allowed == ALL_LETTERS_MASK:  # Every word fits an open position
+                continue
+            if allowed and not allowed & (allowed - 1):  # A fixed position has a single bitset
+                matches &= self.position_bitsets[i, allowed.bit_length() - 1]
+            else:
+                letters = (allowed >> alphabet) & 1 != 0
+                matches &= np.bitwise_or.reduce(self.position_bitsets[i, letters], axis=0)
+        return unpack_bitset(matches, len(self.words))